@@ -71,7 +71,7 @@ def _get_imports_recursively(
     imports = set()
     for task in tasks:
         # Add task imports
-        imports |= set(task.imports)
+        imports.update(task.imports)
 
         def reduce_imports_from_callback(old, item):
             try:
@@ -86,7 +86,7 @@ def _get_imports_recursively(
         imports |= reduce(reduce_imports_from_callback, CALLBACK_KEYS, set())
         if hasattr(task, "tasks"):
             # descend, for a task group
-            imports |= set(_get_imports_recursively(task.tasks.values()))
+            imports.update(_get_imports_recursively(task.tasks.values()))
     return list(sorted(imports, key=str))
 
 
@@ -169,6 +169,12 @@ class OrbiterDAG(OrbiterASTBase, OrbiterBase, extra="allow"):
     :type params: Dict[str, Any], optional
     :param doc_md: Documentation for the DAG with markdown support
     :type doc_md: str, optional
+    :param has_nested_orbiter_deps: Whether tasks (or their callbacks, timetables, etc.)
+        carry their own `orbiter_*` properties or imports.
+        Rulesets that attach everything at the DAG level may set this to `False`,
+        so [`OrbiterProject.add_dags`][orbiter.objects.project.OrbiterProject.add_dags]
+        can skip walking the task tree. Defaults to `None` (unknown - inferred on the first walk)
+    :type has_nested_orbiter_deps: bool, optional
     :param kwargs: Additional keyword arguments to pass to the DAG
     :type kwargs: dict, optional
     :param **OrbiterBase: [OrbiterBase][orbiter.objects.OrbiterBase] inherited properties
@@ -186,6 +192,7 @@ class OrbiterDAG(OrbiterASTBase, OrbiterBase, extra="allow"):
     default_args: Dict[str, Any]
     params: Dict[str, Any]
     doc_md: str | None
+    has_nested_orbiter_deps: bool | None
     tasks: Dict[str, OrbiterOperator]
     kwargs: dict
     orbiter_kwargs: dict
@@ -210,6 +217,7 @@ class OrbiterDAG(OrbiterASTBase, OrbiterBase, extra="allow"):
     default_args: Dict[str, Any] = dict()
     params: Dict[str, Any] = dict()
     doc_md: str | None = None
+    has_nested_orbiter_deps: bool | None = None
 
     tasks: Dict[str, Union[OrbiterOperator, OrbiterTaskGroup]] = dict()
 
@@ -376,14 +384,16 @@ class OrbiterDAG(OrbiterASTBase, OrbiterBase, extra="allow"):
             )
         )
 
-        imports = [i._to_ast() for i in sorted(pre_imports)]
+        # OrbiterASTBase comparisons unparse both operands - sorting on a precomputed
+        # str key renders each entry once, instead of once per comparison
+        imports = [i._to_ast() for i in sorted(pre_imports, key=str)]
 
         # foo = BashOperator(...)
         task_definitions = list(dedupe_callable([task._to_ast() for task in self.tasks.values()]))
 
         # foo >> bar
         task_dependencies = [
-            task._downstream_to_ast() for task in sorted(self.tasks.values()) if task._downstream_to_ast()
+            downstream for task in sorted(self.tasks.values(), key=str) if (downstream := task._downstream_to_ast())
         ]
 
         # with DAG(...) as dag:
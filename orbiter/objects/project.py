@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import os
 import sys
 import re
-from functools import reduce
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, Set, Literal
+from typing import Dict, FrozenSet, Iterable, Set, Literal
+from weakref import WeakKeyDictionary
 
 import yaml
+
+try:
+    # libyaml dumps many-entry settings files several times faster, when available
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 from loguru import logger
 from pydantic import validate_call
 
@@ -34,6 +43,39 @@ OrbiterProject --> "many" OrbiterVariable
 --8<-- [end:mermaid-relationships]
 """
 
+#: `(attribute, private adder)` pairs looked for on every node
+#: when `OrbiterProject.add_dags` walks a DAG tree
+_ORBITER_ATTRS = (
+    ("orbiter_pool", "_add_pools"),
+    ("orbiter_conns", "_add_connections"),
+    ("orbiter_vars", "_add_variables"),
+    ("orbiter_env_vars", "_add_env_vars"),
+    ("orbiter_includes", "_add_includes"),
+    ("imports", "_add_requirements"),
+)
+_ORBITER_ATTRS_BY_NAME = dict(_ORBITER_ATTRS)
+
+#: Per-type cache of `(orbiter attrs present, other attrs to descend into)` for pydantic models,
+#: or `None` for anything else - so the walk introspects each model type once, not once per node
+_TYPE_ATTRS = WeakKeyDictionary()
+
+
+def _attrs_for_type(cls: type) -> tuple[tuple, tuple] | None:
+    try:
+        return _TYPE_ATTRS[cls]
+    except KeyError:
+        fields = getattr(cls, "model_fields", None)
+        cached = (
+            (
+                tuple((name, adder) for name, adder in _ORBITER_ATTRS if name in fields),
+                tuple(name for name in fields if name not in _ORBITER_ATTRS_BY_NAME),
+            )
+            if fields is not None
+            else None
+        )
+        _TYPE_ATTRS[cls] = cached
+        return cached
+
 
 class OrbiterProject:
     # noinspection PyUnresolvedReferences
@@ -82,50 +124,131 @@ class OrbiterProject:
     variables: Dict[str, OrbiterVariable]
     # --8<-- [end:mermaid-props]
 
+    __slots__ = (
+        "_connections",
+        "_dags",
+        "_env_vars",
+        "_includes",
+        "_pools",
+        "_requirements",
+        "_requirements_view",
+        "_variables",
+        "_dag_render_cache",
+        "_repr_cache",
+    )
+
     def __init__(self):
-        self.dags: Dict[str, OrbiterDAG] = dict()
-        self.requirements: Set[OrbiterRequirement] = set()
-        self.pools: Dict[str, OrbiterPool] = dict()
-        self.connections: Dict[str, OrbiterConnection] = dict()
-        self.variables: Dict[str, OrbiterVariable] = dict()
-        self.env_vars: Dict[str, OrbiterEnvVar] = dict()
-        self.includes: Dict[str, OrbiterInclude] = dict()
+        # Containers are allocated lazily, on first access - transient empty projects
+        # (e.g. either side of `OrbiterProject() + OrbiterProject()`) are common, and shouldn't allocate
+        self._dags = None
+        #: keyed `(package, module, names, sys_package)` -> requirement, see `_add_requirements`
+        self._requirements = None
+        self._requirements_view = None
+        self._pools = None
+        self._connections = None
+        self._variables = None
+        self._env_vars = None
+        self._includes = None
+        #: `dag_id` -> `(id(dag), rendered)`, see `_render_dag`
+        self._dag_render_cache = None
+        #: cached `__repr__`, `None` doubles as the dirty flag - any `_add_*` resets it
+        self._repr_cache = None
+
+    @property
+    def connections(self) -> Dict[str, OrbiterConnection]:
+        if self._connections is None:
+            self._connections = dict()
+        return self._connections
+
+    @property
+    def dags(self) -> Dict[str, OrbiterDAG]:
+        if self._dags is None:
+            self._dags = dict()
+        return self._dags
+
+    @property
+    def env_vars(self) -> Dict[str, OrbiterEnvVar]:
+        if self._env_vars is None:
+            self._env_vars = dict()
+        return self._env_vars
+
+    @property
+    def includes(self) -> Dict[str, OrbiterInclude]:
+        if self._includes is None:
+            self._includes = dict()
+        return self._includes
+
+    @property
+    def pools(self) -> Dict[str, OrbiterPool]:
+        if self._pools is None:
+            self._pools = dict()
+        return self._pools
+
+    @property
+    def requirements(self) -> FrozenSet[OrbiterRequirement]:
+        if self._requirements_view is None:
+            self._requirements_view = frozenset((self._requirements or {}).values())
+        return self._requirements_view
+
+    @property
+    def variables(self) -> Dict[str, OrbiterVariable]:
+        if self._variables is None:
+            self._variables = dict()
+        return self._variables
 
     def __add__(self, other) -> "OrbiterProject":
         if not other:
             return self
         if not isinstance(other, OrbiterProject):
             raise TypeError(f"Expected OrbiterProject, got {type(other)}")
-        self.add_dags(other.dags.values())
-        self.add_requirements(other.requirements)
-        self.add_pools(other.pools.values())
-        self.add_connections(other.connections.values())
-        self.add_variables(other.variables.values())
-        self.add_env_vars(other.env_vars.values())
-        self.add_includes(other.includes.values())
+        # Check the other project's slots directly, so adding an empty project allocates nothing
+        if other._dags:
+            self.add_dags(other._dags.values())
+        if other._requirements:
+            self.add_requirements(other._requirements.values())
+        if other._pools:
+            self.add_pools(other._pools.values())
+        if other._connections:
+            self.add_connections(other._connections.values())
+        if other._variables:
+            self.add_variables(other._variables.values())
+        if other._env_vars:
+            self.add_env_vars(other._env_vars.values())
+        if other._includes:
+            self.add_includes(other._includes.values())
         return self
 
     def __eq__(self, other) -> bool:
-        return all(
-            [str(self.dags[d]) == str(other.dags.get(d, "")) for d in self.dags]
-            + [str(self.dags.get(d, "")) == str(other.dags[d]) for d in other.dags]
-            + [self.requirements == other.requirements]
-            + [self.pools == other.pools]
-            + [self.connections == other.connections]
-            + [self.variables == other.variables]
-            + [self.env_vars == other.env_vars]
-        )
+        # Cheap structural checks first - rendering a DAG runs over its whole task tree,
+        # so only render when everything else already matches
+        if self.dags.keys() != other.dags.keys():
+            return False
+        if self.requirements != other.requirements:
+            return False
+        if self.pools != other.pools:
+            return False
+        if self.connections != other.connections:
+            return False
+        if self.variables != other.variables:
+            return False
+        if self.env_vars != other.env_vars:
+            return False
+        return all(self._render_dag(d) == other._render_dag(d) for d in self.dags)
 
     def __repr__(self):
-        return (
-            f"OrbiterProject("
-            f"dags=[{','.join(sorted(self.dags.keys()))}], "
-            f"requirements={sorted(self.requirements)}, "
-            f"pools={sorted(self.pools)}, "
-            f"connections={sorted(self.connections)}, "
-            f"variables={sorted(self.variables)}, "
-            f"env_vars={sorted(self.env_vars)})"
-        )
+        # Logging frameworks repr projects on every log line - six sorts per call adds up,
+        # so rebuild only after something was added
+        if self._repr_cache is None:
+            self._repr_cache = (
+                f"OrbiterProject("
+                f"dags=[{','.join(sorted(self.dags.keys()))}], "
+                f"requirements={sorted(self.requirements)}, "
+                f"pools={sorted(self.pools)}, "
+                f"connections={sorted(self.connections)}, "
+                f"variables={sorted(self.variables)}, "
+                f"env_vars={sorted(self.env_vars)})"
+            )
+        return self._repr_cache
 
     def add_connections(self, connections: OrbiterConnection | Iterable[OrbiterConnection]) -> "OrbiterProject":
         """Add [`OrbiterConnections`][orbiter.objects.connection.OrbiterConnection] to the Project
@@ -164,7 +287,12 @@ class OrbiterProject:
         :return: self
         :rtype: OrbiterProject
         """  # noqa: E501
-        for connection in [connections] if isinstance(connections, OrbiterConnection) else connections:
+        return self._add_connections(connections)
+
+    def _add_connections(self, connections) -> "OrbiterProject":
+        """[`add_connections`][orbiter.objects.project.OrbiterProject.add_connections], without `validate_call`"""
+        self._repr_cache = None
+        for connection in (connections,) if isinstance(connections, OrbiterConnection) else connections:
             self.connections[connection.conn_id] = connection
         return self
 
@@ -249,38 +377,71 @@ class OrbiterProject:
         :return: self
         :rtype: OrbiterProject
         """  # noqa: E501
+        return self._add_dags(dags)
+
+    # noinspection t
+    def _add_dags(self, dags) -> "OrbiterProject":
+        """[`add_dags`][orbiter.objects.project.OrbiterProject.add_dags], without `validate_call`"""
+        self._repr_cache = None
+
+        # One visited-set per add_dags call - `id()`s are only stable while the walked objects are alive,
+        # and shared objects (e.g. one OrbiterConnection referenced by many tasks) only need one visit
+        seen = set()
 
         # noinspection t
         def _add_recursively(
             things: Iterable[OrbiterOperator | OrbiterTaskGroup | OrbiterCallback | OrbiterTimetable | OrbiterDAG],
-        ):
-            for thing in things:
-                if isinstance(thing, str):
+        ) -> bool:
+            """Returns whether anything was (or may already have been) added, to infer `has_nested_orbiter_deps`"""
+            found = False
+            stack = deque(things)
+            while stack:
+                thing = stack.pop()
+                if thing is None or isinstance(thing, (str, int, float, bool)):
+                    continue
+                key = id(thing)
+                if key in seen:
+                    # Already walked (and possibly added) for an earlier DAG in this call - can't rule anything out
+                    found = True
                     continue
-                if hasattr(thing, "orbiter_pool") and (pool := thing.orbiter_pool):
-                    self.add_pools(pool)
-                if hasattr(thing, "orbiter_conns") and (conns := thing.orbiter_conns):
-                    self.add_connections(conns)
-                if hasattr(thing, "orbiter_vars") and (variables := thing.orbiter_vars):
-                    self.add_variables(variables)
-                if hasattr(thing, "orbiter_env_vars") and (env_vars := thing.orbiter_env_vars):
-                    self.add_env_vars(env_vars)
-                if hasattr(thing, "orbiter_includes") and (includes := thing.orbiter_includes):
-                    self.add_includes(includes)
-                if hasattr(thing, "imports") and (imports := thing.imports):
-                    self.add_requirements(imports)
-                if isinstance(thing, OrbiterTaskGroup) and (tasks := thing.tasks):
-                    _add_recursively(tasks.values())
-                if hasattr(thing, "__dict__") or hasattr(thing, "model_extra"):
-                    # If it's a pydantic model or dict, check its properties for more things to add
-                    _add_recursively(
-                        (
-                            (getattr(thing, "__dict__", {}) or dict()) | (getattr(thing, "model_extra", {}) or dict())
-                        ).values()
-                    )
-
-        for dag in [dags] if isinstance(dags, OrbiterDAG) else dags:
+                seen.add(key)
+                type_attrs = _attrs_for_type(type(thing))
+                if type_attrs is not None:
+                    # A pydantic model - its attributes of interest were introspected once, per-type
+                    orbiter_attrs, child_attrs = type_attrs
+                    for name, adder in orbiter_attrs:
+                        if value := getattr(thing, name, None):
+                            getattr(self, adder)(value)
+                            found = True
+                    if isinstance(thing, OrbiterTaskGroup) and (tasks := thing.tasks):
+                        stack.extend(tasks.values())
+                    for name in child_attrs:
+                        stack.append(getattr(thing, name, None))
+                    # `extra="allow"` attributes are per-instance, check them against the same table
+                    for name, value in (thing.model_extra or {}).items():
+                        if not value:
+                            continue
+                        if adder := _ORBITER_ATTRS_BY_NAME.get(name):
+                            getattr(self, adder)(value)
+                            found = True
+                        else:
+                            stack.append(value)
+                else:
+                    # Not a pydantic model - check its properties for more things to add
+                    for name, value in (getattr(thing, "__dict__", None) or {}).items():
+                        if not value:
+                            continue
+                        if adder := _ORBITER_ATTRS_BY_NAME.get(name):
+                            getattr(self, adder)(value)
+                            found = True
+                        else:
+                            stack.append(value)
+            return found
+
+        for dag in (dags,) if isinstance(dags, OrbiterDAG) else dags:
             dag_id = dag.dag_id
+            if self._dag_render_cache:
+                self._dag_render_cache.pop(dag_id, None)
 
             # Add or update the DAG
             if dag_id in self.dags:
@@ -289,7 +450,12 @@ class OrbiterProject:
                 self.dags[dag_id] = dag
 
             # Add anything that might be in the tasks of the DAG - such as imports, Connections, etc
-            _add_recursively((dag.tasks or {}).values())
+            # Rulesets that attach everything at the DAG level can set `has_nested_orbiter_deps=False`
+            # to skip the walk; the default (None) walks once and caches what it learned on the DAG
+            if dag.has_nested_orbiter_deps is not False:
+                found = _add_recursively((dag.tasks or {}).values())
+                if dag.has_nested_orbiter_deps is None:
+                    dag.has_nested_orbiter_deps = found
 
             # Add anything that might be in the `dag.schedule` - such as Includes, Timetables, Connections, etc
             _add_recursively([dag])
@@ -332,7 +498,12 @@ class OrbiterProject:
         :return: self
         :rtype: OrbiterProject
         """
-        for env_var in [env_vars] if isinstance(env_vars, OrbiterEnvVar) else env_vars:
+        return self._add_env_vars(env_vars)
+
+    def _add_env_vars(self, env_vars) -> "OrbiterProject":
+        """[`add_env_vars`][orbiter.objects.project.OrbiterProject.add_env_vars], without `validate_call`"""
+        self._repr_cache = None
+        for env_var in (env_vars,) if isinstance(env_vars, OrbiterEnvVar) else env_vars:
             self.env_vars[env_var.key] = env_var
         return self
 
@@ -371,7 +542,12 @@ class OrbiterProject:
         :return: self
         :rtype: OrbiterProject
         """
-        for include in [includes] if isinstance(includes, OrbiterInclude) else includes:
+        return self._add_includes(includes)
+
+    def _add_includes(self, includes) -> "OrbiterProject":
+        """[`add_includes`][orbiter.objects.project.OrbiterProject.add_includes], without `validate_call`"""
+        self._repr_cache = None
+        for include in (includes,) if isinstance(includes, OrbiterInclude) else includes:
             self.includes[include.filepath] = include
         return self
 
@@ -413,7 +589,12 @@ class OrbiterProject:
         :return: self
         :rtype: OrbiterProject
         """
-        for pool in [pools] if isinstance(pools, OrbiterPool) else pools:
+        return self._add_pools(pools)
+
+    def _add_pools(self, pools) -> "OrbiterProject":
+        """[`add_pools`][orbiter.objects.project.OrbiterProject.add_pools], without `validate_call`"""
+        self._repr_cache = None
+        for pool in (pools,) if isinstance(pools, OrbiterPool) else pools:
             if pool.name in self.pools:
                 self.pools[pool.name] += pool
             else:
@@ -428,12 +609,12 @@ class OrbiterProject:
         >>> OrbiterProject().add_requirements(
         ...    OrbiterRequirement(package="apache-airflow", names=['foo'], module='bar'),
         ... ).requirements
-        {OrbiterRequirement(names=[foo], package=apache-airflow, module=bar, sys_package=None)}
+        frozenset({OrbiterRequirement(names=[foo], package=apache-airflow, module=bar, sys_package=None)})
 
         >>> OrbiterProject().add_requirements(
         ...    [OrbiterRequirement(package="apache-airflow", names=['foo'], module='bar')],
         ... ).requirements
-        {OrbiterRequirement(names=[foo], package=apache-airflow, module=bar, sys_package=None)}
+        frozenset({OrbiterRequirement(names=[foo], package=apache-airflow, module=bar, sys_package=None)})
 
         ```
 
@@ -458,8 +639,19 @@ class OrbiterProject:
         :return: self
         :rtype: OrbiterProject
         """
-        for requirement in [requirements] if isinstance(requirements, OrbiterRequirement) else requirements:
-            self.requirements.add(requirement)
+        return self._add_requirements(requirements)
+
+    def _add_requirements(self, requirements) -> "OrbiterProject":
+        """[`add_requirements`][orbiter.objects.project.OrbiterProject.add_requirements], without `validate_call`"""
+        self._repr_cache = None
+        if self._requirements is None:
+            self._requirements = dict()
+        for requirement in (requirements,) if isinstance(requirements, OrbiterRequirement) else requirements:
+            # Hashing this key tuple is much cheaper than hashing the full model,
+            # and covers the same fields as OrbiterRequirement.__hash__
+            key = (requirement.package, requirement.module, tuple(requirement.names), requirement.sys_package)
+            self._requirements.setdefault(key, requirement)
+        self._requirements_view = None
         return self
 
     def add_variables(self, variables: OrbiterVariable | Iterable[OrbiterVariable]) -> "OrbiterProject":
@@ -496,10 +688,29 @@ class OrbiterProject:
         :return: self
         :rtype: OrbiterProject
         """
-        for variable in [variables] if isinstance(variables, OrbiterVariable) else variables:
+        return self._add_variables(variables)
+
+    def _add_variables(self, variables) -> "OrbiterProject":
+        """[`add_variables`][orbiter.objects.project.OrbiterProject.add_variables], without `validate_call`"""
+        self._repr_cache = None
+        for variable in (variables,) if isinstance(variables, OrbiterVariable) else variables:
             self.variables[variable.key] = variable
         return self
 
+    def _render_dag(self, dag_id: str) -> str:
+        """`str(dag)` unparses the whole task tree, and is re-requested by `__eq__` and `render` -
+        cache the rendered source per `dag_id`, keyed on the identity of the currently-registered DAG
+        (and invalidated by `add_dags`)"""
+        dag = self.dags[dag_id]
+        if self._dag_render_cache is None:
+            self._dag_render_cache = dict()
+        cached = self._dag_render_cache.get(dag_id)
+        if cached is not None and cached[0] == id(dag):
+            return cached[1]
+        rendered = str(dag)
+        self._dag_render_cache[dag_id] = (id(dag), rendered)
+        return rendered
+
     def render(self, output_dir: Path) -> None:
         if not len(self.dags):
             raise RuntimeError("No DAGs to render!")
@@ -510,25 +721,52 @@ class OrbiterProject:
         dags.mkdir(parents=True, exist_ok=True)
 
         # /dags/*
+        # Plain os.path string ops - Path construction per DAG costs ~10x as much
+        dags_str = str(dags)
+        work = []
         for dag_id, dag in self.dags.items():
-            dag_file = dags / dag.file_path
             logger.debug(f"Writing {dag.file_path}")
-            dag_file.parent.mkdir(parents=True, exist_ok=True)
-            dag_file.write_text(str(dag))
+            # Encode once up-front - _write_dag_file writes the raw bytes
+            work.append((os.path.join(dags_str, dag.file_path), self._render_dag(dag_id).encode("utf-8")))
+
+        # Pre-create every (unique) parent folder up-front, so the parallel writes can't race on mkdir
+        for parent in {os.path.dirname(dag_file) for dag_file, _ in work}:
+            os.makedirs(parent, exist_ok=True)
+
+        def _write_dag_file(file_and_payload):
+            # Write via a raw fd - skips Path.write_text's TextIOWrapper/encoding layer per file
+            dag_file, payload = file_and_payload
+            fd = os.open(dag_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+
+        # File writes release the GIL, so a small thread pool overlaps the per-file flush latency
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            list(executor.map(_write_dag_file, work))
+
+        # Collect python and system packages in one pass over the requirements
+        pkgs, sys_pkgs = set(), set()
+        for r in self.requirements:
+            if r.package:
+                pkgs.add(r.package)
+            if r.sys_package:
+                sys_pkgs.add(r.sys_package)
 
         # requirements.txt
-        if len([1 for r in self.requirements if r.package]):
+        if pkgs:
             requirements = output_dir / "requirements.txt"
             logger.info(f"Writing {requirements}")
-            requirements.write_text("\n".join(sorted(set(r.package for r in self.requirements if r.package))))
+            requirements.write_text("\n".join(sorted(pkgs)))
         else:
             logger.debug("No python packages to write, skipping requirements.txt...")
 
         # packages.txt
-        if len([1 for r in self.requirements if r.sys_package]):
+        if sys_pkgs:
             packages = output_dir / "packages.txt"
             logger.info(f"Writing {packages}")
-            packages.write_text("\n".join(sorted(set(r.sys_package for r in self.requirements if r.sys_package))))
+            packages.write_text("\n".join(sorted(sys_pkgs)))
         else:
             logger.debug("No system packages to write, skipping packages.txt...")
 
@@ -536,25 +774,26 @@ class OrbiterProject:
         if any((len(self.pools), len(self.variables), len(self.connections))):
             airflow_settings = output_dir / "airflow_settings.yaml"
             logger.info(f"Writing {airflow_settings}")
-            yaml.safe_dump(
-                {
-                    "airflow": {
-                        "pools": [pool.render() for pool in self.pools.values()],
-                        "variables": [variable.render() for variable in self.variables.values()],
-                        "connections": [connection.render() for connection in self.connections.values()],
-                    }
-                },
+            pools = [pool.render() for pool in self.pools.values()]
+            variables = [variable.render() for variable in self.variables.values()]
+            connections = [connection.render() for connection in self.connections.values()]
+            yaml.dump(
+                {"airflow": {"pools": pools, "variables": variables, "connections": connections}},
                 airflow_settings.open("w"),
+                Dumper=SafeDumper,
+                default_flow_style=False,
             )
         else:
             logger.debug("No Pools, Variables, or Connections to write. Skipping airflow_settings.yaml...")
 
         # /include
         if len(self.includes):
-            for include in self.includes.values():
-                include_path = output_dir / include.filepath
+            include_files = [(output_dir / include.filepath, include) for include in self.includes.values()]
+            # mkdir each unique parent folder once, not once per include
+            for parent in {include_path.parent for include_path, _ in include_files}:
+                parent.mkdir(parents=True, exist_ok=True)
+            for include_path, include in include_files:
                 logger.info(f"Writing {include_path}")
-                include_path.parent.mkdir(parents=True, exist_ok=True)
                 include_path.write_text(include.render())
         else:
             logger.debug("No files to include")
@@ -611,34 +850,18 @@ class OrbiterProject:
             match_or_task_type = (match.groupdict().get("task_type") if match else None) or type(task).__name__
             return match_or_task_type
 
-        dag_analysis = [
-            {
-                "file": dag.orbiter_kwargs.get("file_path", dag.file_path),
-                "dag_id": dag.dag_id,
-                "task_types": [get_task_type(task) for task in dag.tasks.values()],
-            }
-            for dag in self.dags.values()
-        ]
-
-        file_analysis = {}
-        for analysis in dag_analysis:
-            analysis_output = file_analysis.get(analysis["file"], {})
-            analysis_output["DAGs"] = analysis_output.get("DAGs", 0) + 1
-            tasks_of_type = reduce(
-                lambda acc, task_type: acc | {task_type: acc.get(task_type, 0) + 1},
-                analysis["task_types"],
-                dict(),
-            )
-            analysis_output |= tasks_of_type
-            file_analysis[analysis["file"]] = analysis_output
+        # One pass over the DAGs, accumulating per-file counts directly
+        file_analysis = defaultdict(Counter)
+        for dag in self.dags.values():
+            counts = file_analysis[dag.orbiter_kwargs.get("file_path", dag.file_path)]
+            counts["DAGs"] += 1
+            counts.update(get_task_type(task) for task in dag.tasks.values())
 
+        totals = Counter()
+        for counts in file_analysis.values():
+            totals.update(counts)
         file_analysis = [{"": k} | v for k, v in file_analysis.items()]
-        totals = {"": "Totals"}
-        for file in file_analysis:
-            for k, v in file.items():
-                if k != "":
-                    totals[k] = totals.get(k, 0) + v
-        file_analysis.append(totals)
+        file_analysis.append({"": "Totals"} | totals)
 
         if output_fmt == "json":
             import json